@@ -1,5 +1,7 @@
+import json
 import unittest
 
+import versioned_config
 from versioned_config import VersionedConfigObject
 from versioned_config.data_types import BinaryBlob
 
@@ -19,9 +21,27 @@ class TestDataTypes(unittest.TestCase):
 
         c1 = TestClass()
         s = c1.dumps()
-        self.assertEqual('{"var1": 0.0, "var2": "SGVsbG8sIHdvcmxkIQ=="}', s)
+        self.assertEqual({"var1": 0.0, "var2": "SGVsbG8sIHdvcmxkIQ=="}, json.loads(s))
 
         c2 = TestClass()
         c2.loads(s)
         self.assertEqual(c2.var1, 0.0)
         self.assertEqual(c2.var2.data, b'Hello, world!')
+
+    def test_binary_blob_output_mode(self):
+        blob = BinaryBlob(b'Hello, world!')
+
+        # Default mode produces a base64 str
+        self.assertEqual(blob.to_json_serializable(), "SGVsbG8sIHdvcmxkIQ==")
+
+        versioned_config.set_output_mode('bytes')
+        try:
+            self.assertEqual(blob.to_json_serializable(), b"SGVsbG8sIHdvcmxkIQ==")
+        finally:
+            versioned_config.set_output_mode('str')
+
+        # Back to str output after restoring the mode
+        self.assertEqual(blob.to_json_serializable(), "SGVsbG8sIHdvcmxkIQ==")
+
+    def test_set_output_mode_invalid(self):
+        self.assertRaises(ValueError, versioned_config.set_output_mode, 'unicode')
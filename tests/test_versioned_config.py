@@ -1,7 +1,8 @@
+import json
 import os
 import unittest
 
-from versioned_config import VersionedConfigObject
+from versioned_config import VersionedConfigObject, VersionedConfigJSONEncoder
 from versioned_config import ObjectNotSerializableError, InvalidFieldName, VersionedConfigMigrationError
 
 
@@ -140,7 +141,7 @@ class TestVersionedConfig(unittest.TestCase):
         ca.v2.v2 = 33.33
 
         s = ca.dumps()
-        self.assertEqual('{"v1": 11.11, "v2": {"v1": 22.22, "v2": 33.33}}', s)
+        self.assertEqual({"v1": 11.11, "v2": {"v1": 22.22, "v2": 33.33}}, json.loads(s))
 
         cb = C2()
         cb.loads(s)
@@ -345,6 +346,85 @@ class TestVersionedConfig(unittest.TestCase):
         self.assertEqual(d["abcdefg"], "9.9.9")
         self.assertEqual(d["var1"], "data")
 
+    def test_unversioned_dumps_loads_non_str_dict_keys(self):
+        c1 = new_config_obj(dictvar={1: "a", 2: "b"})
+        s = c1.dumps()
+
+        # Non-str keys are coerced to strings, as stdlib json.dumps does
+        self.assertEqual({"dictvar": {"1": "a", "2": "b"}}, json.loads(s))
+
+        c2 = new_config_obj(dictvar={})
+        c2.loads(s)
+        self.assertEqual(c2.dictvar, {"1": "a", "2": "b"})
+
+    def test_unversioned_bool_not_coerced_to_int(self):
+        c1 = new_config_obj(boolvar=True, intvar=1)
+        s = c1.dumps()
+
+        c2 = new_config_obj(boolvar=False, intvar=0)
+        c2.loads(s)
+
+        self.assertIs(c2.boolvar, True)
+        self.assertIsInstance(c2.intvar, int)
+        self.assertNotIsInstance(c2.intvar, bool)
+        self.assertEqual(c2.intvar, 1)
+
+    def test_unversioned_from_dict(self):
+        c = new_config_obj(var1=1, var2="a")
+        ret = c.from_dict({'var1': 99, 'var2': "zz"})
+
+        self.assertIs(ret, c)
+        self.assertEqual(c.var1, 99)
+        self.assertEqual(c.var2, "zz")
+
+    def test_fast_apply_detection(self):
+        # A plain subclass takes the bulk __dict__.update load path
+        class C1(VersionedConfigObject):
+            def __init__(self):
+                self.v1 = 1
+
+        self.assertTrue(C1._fast_apply)
+
+        # A subclass with a property keeps the per-attribute setattr path
+        class C2(VersionedConfigObject):
+            def __init__(self):
+                self.v1 = 1
+                self._v2 = None
+
+            @property
+            def v2(self):
+                return self._v2
+
+            @v2.setter
+            def v2(self, value):
+                self._v2 = value
+
+        self.assertFalse(C2._fast_apply)
+
+        # So does a subclass that defines its own __setattr__
+        class C3(VersionedConfigObject):
+            def __setattr__(self, name, value):
+                object.__setattr__(self, name, value)
+
+        self.assertFalse(C3._fast_apply)
+
+    def test_json_encoder_matches_to_json_serializable(self):
+        class VC1(VersionedConfigObject):
+            VERSION = "1.0.0"
+
+            def __init__(self):
+                self.var1 = 11
+                self.var2 = "abc"
+
+        class VC2(VersionedConfigObject):
+            def __init__(self):
+                self.var1 = [1, 2, 3]
+                self.var2 = VC1()
+
+        c = VC2()
+        s = json.dumps(c, cls=VersionedConfigJSONEncoder)
+        self.assertEqual(c.to_json_serializable(), json.loads(s))
+
     def test_versioned_config_multiple_migrations(self):
         class VC1(VersionedConfigObject):
             VERSION = "1.0.3"
@@ -5,12 +5,146 @@ __maintainer__ = "Erik Nyquist"
 __email__ = "eknyquist@gmail.com"
 
 
+import io
 import json
+import keyword
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from versioned_config.exceptions import ObjectNotSerializableError, InvalidFieldName, VersionedConfigMigrationError
 
 
-DEFAULT_CONFIG_VERSION_KEY = "config_version"
+DEFAULT_CONFIG_VERSION_KEY = sys.intern("config_version")
+
+# Output type produced by binary-blob fields when serialized; see set_output_mode
+_BLOB_OUTPUT_MODE = 'str'
+
+
+def set_output_mode(mode: str):
+    """
+    Set the output type produced by binary-blob fields (e.g. BinaryBlob) when
+    serialized. 'str' (the default) produces base64 str values that any JSON
+    encoder accepts. 'bytes' produces raw base64 bytes, skipping the final
+    bytes-to-str decode, for callers feeding the serialized dict to an encoder
+    or sink that handles bytes values itself.
+
+    :param str mode: 'str' or 'bytes'
+    """
+    global _BLOB_OUTPUT_MODE
+
+    if mode not in ('str', 'bytes'):
+        raise ValueError(f"Invalid output mode {mode!r}, must be 'str' or 'bytes'")
+
+    _BLOB_OUTPUT_MODE = mode
+
+# Types that can be handed to the JSON encoder as-is. Checked by exact type,
+# so this doubles as an O(1) membership test in the per-field hot loops.
+_SERIALIZABLE_BUILTINS = frozenset((int, float, bool, str, list, dict))
+
+
+# Sentinel for dict lookups where None is a legal value
+_MISSING = object()
+
+
+def _normalize_version(version):
+    """
+    Convert a dotted numeric version string (e.g. "1.0.2") to a tuple of ints,
+    which is cheaper to hash and compare than an arbitrary-length string. Any
+    other value is returned unchanged, so non-numeric version identifiers keep
+    working.
+
+    :param version: version value to normalize
+
+    :return: tuple of ints, or the unchanged input value
+    """
+    if type(version) is str:
+        parts = version.split('.')
+        if all(p.isdigit() for p in parts):
+            return tuple(int(p) for p in parts)
+
+    return version
+
+
+def _queue_child(n, obj, children):
+    """
+    Handle a non-builtin field encountered while building a config object's
+    attribute dict: queue nested config objects for later expansion, raise for
+    anything else
+
+    :param n: field name
+    :param obj: field value
+    :param children: list to queue (name, nested config object) pairs on
+
+    :return: serialized value, or a None placeholder for queued children
+    """
+    if isinstance(obj, VersionedConfigObject):
+        if type(obj).to_json_serializable is VersionedConfigObject.to_json_serializable:
+            children.append((n, obj))
+            return None
+
+        # Subclass provides its own serialized representation
+        return obj.to_json_serializable()
+
+    # Object is not serializable
+    raise ObjectNotSerializableError(f"Object type {type(obj).__name__!r} is not serializable")
+
+
+def _compile_attrs_builder(names):
+    """
+    Generate a function specialized for one config object shape, which reads
+    each named attribute directly and builds the attribute dict as a single
+    dict literal. Builtin fields keep a cheap exact-type guard so a field that
+    is later re-assigned to a non-builtin value is still handled correctly.
+
+    :param names: tuple of field names to specialize for
+
+    :return: compiled function taking (cfg, children), returning the attribute dict
+    """
+    lines = ['def _build(cfg, children):']
+    for i, n in enumerate(names):
+        lines.append(f'    _v{i} = cfg.{n}')
+
+    lines.append('    return {')
+    for i, n in enumerate(names):
+        lines.append(f'        {n!r}: _v{i} if type(_v{i}) in _SB else _qc({n!r}, _v{i}, children),')
+
+    lines.append('    }')
+
+    namespace = {'_SB': _SERIALIZABLE_BUILTINS, '_qc': _queue_child}
+    exec('\n'.join(lines), namespace)
+    return namespace['_build']
+
+
+
+
+def _orjson_options(kwargs):
+    """
+    Map json.dump/json.dumps-style kwargs onto an orjson option mask
+
+    :param dict kwargs: kwargs passed to dump/dumps
+
+    :return: orjson option mask, or None if the kwargs can only be handled by the stdlib json module
+    """
+    # Coerce non-str dict keys to strings, matching stdlib json.dumps behavior
+    option = orjson.OPT_NON_STR_KEYS
+    for key, value in kwargs.items():
+        if key == 'sort_keys':
+            if value:
+                option |= orjson.OPT_SORT_KEYS
+        elif key == 'indent':
+            if value == 2:
+                option |= orjson.OPT_INDENT_2
+            else:
+                return None
+        else:
+            # kwarg with no orjson equivalent (cls, default, separators, etc.)
+            return None
+
+    return option
 
 
 class VersionedConfigMigration(object):
@@ -18,6 +152,9 @@ class VersionedConfigMigration(object):
     Container class for data required to migrate a config object from one version
     to the next version
     """
+
+    __slots__ = ('from_version', 'to_version', 'migrate_func')
+
     def __init__(self, from_version, to_version, migrate_func: callable):
         """
         :param from_version: version to migrate from
@@ -29,7 +166,10 @@ class VersionedConfigMigration(object):
         self.migrate_func = migrate_func
 
     def migrate(self, attrs: dict) -> dict:
-        return self.migrate_func(attrs)
+        # Migration functions may mutate attrs in place and return None, or
+        # return a replacement dict
+        ret = self.migrate_func(attrs)
+        return attrs if ret is None else ret
 
 
 class VersionedConfigObject(object):
@@ -38,16 +178,136 @@ class VersionedConfigObject(object):
     from, a JSON-serializable dict.
     """
 
+    # Empty slots on the base class keep it out of the way of subclasses:
+    # ordinary subclasses still get an instance dict automatically (which the
+    # generic serializer requires), while subclasses that serialize some other
+    # way (e.g. BinaryBlob) may declare their own __slots__ to drop the
+    # per-instance dict entirely, provided they override to_json_serializable
+    # and from_json_serializable.
+    __slots__ = ()
+
     VERSION = None
 
-    def _is_serializable_builtin(self, obj) -> bool:
+    # Resolved per-subclass by __init_subclass__, so serialization reads plain
+    # class attributes instead of re-resolving VERSION through the MRO per call
+    _is_versioned = False
+    _resolved_version = None
+    _fast_apply = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._resolved_version = cls.VERSION
+        cls._is_versioned = cls.VERSION is not None
+
+        # Classes that add no data descriptors of their own (and don't define
+        # __setattr__) can have loaded fields bulk-applied straight into the
+        # instance dict, bypassing the per-attribute __setattr__ protocol. The
+        # base class's own property (config_version_key) never collides with a
+        # loadable field name, and the __dict__/__weakref__ descriptors that
+        # the first non-slotted subclass defines aren't field descriptors.
+        cls._fast_apply = (cls.__setattr__ is object.__setattr__) and not any(
+            hasattr(v, '__set__')
+            for klass in cls.__mro__
+            if (klass is not VersionedConfigObject) and (klass is not object)
+            for n, v in vars(klass).items()
+            if n not in ('__dict__', '__weakref__')
+        )
+
+    @staticmethod
+    def _is_serializable_builtin(obj) -> bool:
         """
         Check if an object is a builtin serializable type
 
         :param obj: object to check
         :return: True if object is builtin serializable type
         """
-        return type(obj) in [int, float, bool, str, list, dict]
+        return type(obj) in _SERIALIZABLE_BUILTINS
+
+    def _cached_field_names(self) -> tuple:
+        """
+        Return the names of all serializable instance variables, as a tuple (for
+        ordered iteration) and a frozenset (for membership tests), plus a
+        frozenset of the names whose values are nested config objects. The
+        result is cached in the instance dict, and re-computed only when the
+        number of instance attributes changes.
+
+        :return: tuple of (name tuple, name frozenset, nested-config name frozenset)
+        """
+        d = self.__dict__
+        cached = d.get('_field_names_cache')
+        if (cached is not None) and (cached[0] == len(d)):
+            return cached[1], cached[2], cached[3]
+
+        # Field discovery is a single walk over the instance dict; class-level
+        # attributes, methods and properties never appear in it, so the only
+        # filtering needed is for underscore names and callables assigned as
+        # instance attributes
+        # Names are interned so dict/set probes against them can succeed on
+        # pointer equality instead of a full string compare
+        # Attribute names are never empty, so indexing the first character is
+        # safe and avoids startswith's argument handling
+        _callable = callable
+        names = tuple(sys.intern(n) for n, v in d.items() if (n[0] != '_') and (not _callable(v)))
+
+        # Intern the name tuple + frozenset per class, so many instances with
+        # the same shape share one copy and only the first pays to build it
+        cls = type(self)
+        intern_table = cls.__dict__.get('_field_names_intern')
+        if intern_table is None:
+            intern_table = {}
+            setattr(cls, '_field_names_intern', intern_table)
+
+        shared = intern_table.get(names)
+        if shared is None:
+            intern_table[names] = shared = (names, frozenset(names))
+
+        # Which fields hold nested config objects; per-instance, since two
+        # instances with the same names can hold different value types
+        recurse = frozenset(n for n in shared[0] if isinstance(d[n], VersionedConfigObject))
+
+        # Insert the cache entry before sizing the dict, so that the entry
+        # itself is counted towards the size it is validated against
+        d['_field_names_cache'] = None
+        d['_field_names_cache'] = cached = (len(d), shared[0], shared[1], recurse)
+
+        return cached[1], cached[2], cached[3]
+
+    def _attrs_builder(self, names):
+        """
+        Return a compiled attribute-dict builder specialized for the given field
+        names, generating and caching one on this object's class if necessary
+
+        :param names: tuple of field names
+
+        :return: compiled builder function, or None if these names cannot be specialized
+        """
+        cls = type(self)
+        cache = cls.__dict__.get('_attrs_builder_cache')
+        if cache is None:
+            cache = {}
+            setattr(cls, '_attrs_builder_cache', cache)
+
+        build = cache.get(names, _MISSING)
+        if build is _MISSING:
+            # Names that aren't plain identifiers (possible via setattr) can't
+            # be read with attribute syntax in generated code
+            if all((n.isidentifier() and (not keyword.iskeyword(n))) for n in names):
+                build = _compile_attrs_builder(names)
+            else:
+                build = None
+
+            cache[names] = build
+
+        return build
+
+    def _allowed_fields(self) -> frozenset:
+        """
+        Return the cached frozenset of field names that may appear in loaded
+        config data for this object
+
+        :return: frozenset of allowed field names
+        """
+        return self._cached_field_names()[1]
 
     def _is_instance_var(self, attrname: str) -> bool:
         """
@@ -57,15 +317,14 @@ class VersionedConfigObject(object):
 
         :return: True if attribute is serializable instance variable
         """
-        return hasattr(self, attrname) and (not callable(self.__dict__[attrname])) and (not attrname.startswith('_'))
+        v = self.__dict__.get(attrname, _MISSING)
+        return (v is not _MISSING) and (not callable(v)) and (attrname[:1] != '_')
 
     def _instance_varname_generator(self):
         """
         Returns a generator that generates all names of serializable instance variables
         """
-        for n in self.__dict__:
-            if (not callable(self.__dict__[n])) and (not n.startswith('_')):
-                yield n
+        yield from self._cached_field_names()[0]
 
     def _migrate(self, attrs: dict, old_version, target_version):
         """
@@ -74,18 +333,50 @@ class VersionedConfigObject(object):
         :param attrs: attributes to migrate
         :param old_version: old version to migrate from
         :param new_version: current config object version to migrate to
-        """
-        curr_version = old_version
-
-        if hasattr(self, '_migrations'):
-            for m in self._migrations:
-                if m.from_version == curr_version:
-                    attrs = m.migrate(attrs)
-                    curr_version = m.to_version
 
-            if curr_version == target_version:
+        :return: the migrated attributes dict (the same dict that was passed in,
+            unless a migration function returned a replacement)
+        """
+        # Comparisons and index lookups work on normalized versions; the
+        # original values are kept for error reporting
+        curr_version = _normalize_version(old_version)
+        target = _normalize_version(target_version)
+
+        if curr_version == target:
+            # Nothing to do
+            return attrs
+
+        index = getattr(self, '_migration_index', None)
+        if index:
+            # Re-loading the same old version is common, so successful chain
+            # walks are memoized as a flat tuple of migration functions
+            path_cache = self._migration_path_cache
+            path = path_cache.get((curr_version, target))
+            if path is not None:
+                for migrate in path:
+                    attrs = migrate(attrs)
+
+                return attrs
+
+            # Walk the chain of registered migrations by direct lookup; the step
+            # count is bounded so a cycle of registered versions cannot loop forever
+            start = curr_version
+            fns = []
+            steps = len(index)
+            while steps and (curr_version != target):
+                entry = index.get(curr_version)
+                if entry is None:
+                    break
+
+                curr_version, migrate = entry
+                attrs = migrate(attrs)
+                fns.append(migrate)
+                steps -= 1
+
+            if curr_version == target:
                 # Success
-                return
+                path_cache[(start, target)] = tuple(fns)
+                return attrs
 
         raise VersionedConfigMigrationError("Failed to migrate %s from version %s to version %s" %
                                             (self.__class__.__name__, old_version, target_version))
@@ -95,10 +386,7 @@ class VersionedConfigObject(object):
         """
         Return the string to be used for the key of the version field in this confib object
         """
-        if hasattr(self, '_config_version_key'):
-            return self._config_version_key
-
-        return DEFAULT_CONFIG_VERSION_KEY
+        return self.__dict__.get('_config_version_key', DEFAULT_CONFIG_VERSION_KEY)
 
     @config_version_key.setter
     def config_version_key(self, value: str):
@@ -107,7 +395,7 @@ class VersionedConfigObject(object):
 
         :param str value: String to be used for version key
         """
-        setattr(self, '_config_version_key', value)
+        setattr(self, '_config_version_key', sys.intern(value))
 
     def to_json_serializable(self) -> object:
         """
@@ -118,63 +406,146 @@ class VersionedConfigObject(object):
 
         :return: dict suitable for passing to json.dump
         """
-        attrs = {}
-        for n in self._instance_varname_generator():
+        root = None
+
+        # Iterative depth-first traversal; nested config objects are expanded
+        # from an explicit work stack instead of recursive method calls
+        stack = [(self, None, None)]
 
-            obj = getattr(self, n)
+        while stack:
+            cfg, parent, key = stack.pop()
 
-            if isinstance(obj, VersionedConfigObject):
-                # Object is another ConfigObject instance
-                attrs[n] = obj.to_json_serializable()
-            elif self._is_serializable_builtin(obj):
-                # Object is something else that can be serialized by json library
-                attrs[n] = obj
+            names = cfg._cached_field_names()[0]
+            children = []
+
+            # Build this level's dict with a builder compiled for this exact
+            # shape where possible; nested config objects get a None
+            # placeholder which is overwritten when they come off the stack
+            build = cfg._attrs_builder(names)
+            if build is not None:
+                attrs = build(cfg, children)
             else:
-                # Object is not serializable
-                raise ObjectNotSerializableError("Object type '%s' is not serializable" %
-                                                 obj.__class__.__name__)
+                attrs = {n: (obj if type(obj) in _SERIALIZABLE_BUILTINS else _queue_child(n, obj, children))
+                         for n, obj in ((n, getattr(cfg, n)) for n in names)}
+
+            # Check if this class is versioned
+            if cfg._is_versioned:
+                vkey = cfg.config_version_key
+                if vkey in attrs:
+                    raise ValueError(f"Cannot have an attribute with name {vkey!r}, name is reserved")
+
+                attrs[vkey] = type(cfg)._resolved_version
 
-        # Check if this class is versioned
-        if self.__class__.VERSION is not None :
-            if self.config_version_key in attrs:
-                raise ValueError("Cannot have an attribute with name '%s', name is reserved" % n)
+            for n, child in children:
+                stack.append((child, attrs, n))
 
-            attrs[self.config_version_key] = self.__class__.VERSION
+            if parent is None:
+                root = attrs
+            else:
+                parent[key] = attrs
 
-        return attrs
+        return root
 
     def from_json_serializable(self, attrs: object):
         """
         Load new values into this config object's instance variables, from a JSON-serializable dict
 
+        The version key is not removed from the passed dict; aside from whatever
+        registered migration functions do, the passed dict is not modified.
+        Nested config objects are handed their sub-dicts directly rather than
+        copies, so migration functions for nested objects operate on (and may
+        mutate) the nested dicts of the dict passed here.
+
         :param attrs: JSON-serializable dict to load from
 
         :raise VersionedConfigMigrationError: if an older config object can't be migrated to the current version
         :raise InvalidFieldName: if config data contains a field name not present in class
         :raise ObjectNotSerializableError: if object cannot be de-serialized
         """
-        # Is this class versioned?
-        if self.config_version_key in attrs:
-            # Do the versions match?
-            if attrs[self.config_version_key] != self.__class__.VERSION:
-                self._migrate(attrs, attrs[self.config_version_key], self.__class__.VERSION)
-
-            del attrs[self.config_version_key]
-
-        # Migration successful, or not needed
-        for n in attrs:
-            if not self._is_instance_var(n):
-                raise InvalidFieldName("Unrecognized field name '%s'" % n)
-
-            obj = getattr(self, n)
-            if isinstance(obj, VersionedConfigObject):
-                # Object is another ConfigObject instance
-                obj.from_json_serializable(attrs[n])
-            elif self._is_serializable_builtin(obj):
-                setattr(self, n, attrs[n])
+        # Iterative depth-first traversal; nested config objects are expanded
+        # from an explicit work stack instead of recursive method calls
+        stack = [(self, attrs)]
+
+        # Bind hot globals to locals for the per-field classification
+        builtins = _SERIALIZABLE_BUILTINS
+        base_from_json = VersionedConfigObject.from_json_serializable
+
+        while stack:
+            cfg, attrs = stack.pop()
+
+            # Is this class versioned?
+            vkey = cfg.config_version_key
+            loaded_version = attrs.get(vkey, _MISSING)
+            if loaded_version is not _MISSING:
+                # Do the versions match?
+                version = type(cfg)._resolved_version
+                if loaded_version != version:
+                    attrs = cfg._migrate(attrs, loaded_version, version)
             else:
-                raise ObjectNotSerializableError("Object type '%s' is not de-serializable" %
-                                                 obj.__class__.__name__)
+                vkey = None
+
+            # Migration successful, or not needed. Validate all incoming names
+            # with one C-level set difference instead of a per-field test
+            _, allowed, recurse = cfg._cached_field_names()
+            bad = attrs.keys() - allowed
+            if vkey is not None:
+                bad.discard(vkey)
+
+            if bad:
+                raise InvalidFieldName(f"Unrecognized field name {sorted(bad)[0]!r}")
+
+            pending = {} if type(cfg)._fast_apply else None
+            for n, incoming in attrs.items():
+                if n == vkey:
+                    # Version key is handled above, not loaded as a field
+                    continue
+
+                if n in recurse:
+                    # Field held a nested config object when the cache was
+                    # built; jump straight to the nested-object dispatch. Falls
+                    # through to the generic checks if the field has since been
+                    # re-assigned to something else.
+                    obj = getattr(cfg, n)
+                    from_json = getattr(type(obj), 'from_json_serializable', None)
+                    if from_json is not None:
+                        if from_json is base_from_json:
+                            # Object is another ConfigObject instance; expand it on the stack
+                            stack.append((obj, incoming))
+                        else:
+                            # Subclass provides its own de-serialization
+                            obj.from_json_serializable(incoming)
+
+                        continue
+
+                obj = getattr(cfg, n)
+                if type(obj) in builtins:
+                    if pending is None:
+                        setattr(cfg, n, incoming)
+                    else:
+                        pending[n] = incoming
+                elif isinstance(obj, VersionedConfigObject):
+                    if type(obj).from_json_serializable is base_from_json:
+                        # Object is another ConfigObject instance; expand it on the stack
+                        stack.append((obj, incoming))
+                    else:
+                        # Subclass provides its own de-serialization
+                        obj.from_json_serializable(incoming)
+                else:
+                    raise ObjectNotSerializableError(f"Object type {type(obj).__name__!r} is not de-serializable")
+
+            if pending:
+                # Bulk-apply all builtin fields with one C-level dict update
+                cfg.__dict__.update(pending)
+
+    def from_dict(self, attrs: dict):
+        """
+        Populate this config object from an already-parsed dict, skipping the
+        JSON parse step entirely
+
+        :param dict attrs: dict to load from
+        """
+        self.from_json_serializable(attrs)
+        return self
 
     def add_migration(self, from_version, to_version, migration_func):
         """
@@ -182,12 +553,23 @@ class VersionedConfigObject(object):
 
         :param from_version: version to migrate from
         :param to_version: version to migrate to
-        :param migration_func: function to perform the migration
+        :param migration_func: function to perform the migration; may mutate the
+            passed attrs dict in place and return None, or return a new dict
         """
         if not hasattr(self, '_migrations'):
             setattr(self, '_migrations', [])
+            setattr(self, '_migration_index', {})
+            setattr(self, '_migration_path_cache', {})
 
-        self._migrations.append(VersionedConfigMigration(from_version, to_version, migration_func))
+        m = VersionedConfigMigration(from_version, to_version, migration_func)
+        self._migrations.append(m)
+
+        # The index holds plain (to_version, migrate) tuples so each hop of the
+        # chain walk is two tuple loads rather than attribute lookups
+        self._migration_index[_normalize_version(from_version)] = (_normalize_version(to_version), m.migrate)
+
+        # Any previously-memoized paths may no longer be the right ones
+        self._migration_path_cache.clear()
 
     def dump(self, fp, **kwargs):
         """
@@ -196,6 +578,17 @@ class VersionedConfigObject(object):
         :param fp: file handle to write JSON data to
         :param kwargs: accepts same kwargs as json.dump function
         """
+        if orjson is not None:
+            option = _orjson_options(kwargs)
+            if option is not None:
+                data = orjson.dumps(self.to_json_serializable(), option=option)
+                if isinstance(fp, io.TextIOBase):
+                    fp.write(data.decode())
+                else:
+                    fp.write(data)
+
+                return
+
         return json.dump(self.to_json_serializable(), fp, **kwargs)
 
     def dumps(self, **kwargs) -> str:
@@ -206,6 +599,11 @@ class VersionedConfigObject(object):
 
         :return: string containing JSON data
         """
+        if orjson is not None:
+            option = _orjson_options(kwargs)
+            if option is not None:
+                return orjson.dumps(self.to_json_serializable(), option=option).decode()
+
         return json.dumps(self.to_json_serializable(), **kwargs)
 
     def load(self, fp, **kwargs):
@@ -215,7 +613,16 @@ class VersionedConfigObject(object):
         :param fp: file handle to read JSON data from
         :param kwargs: accepts same kwargs as json.load function
         """
-        self.from_json_serializable(json.load(fp, **kwargs))
+        # Read the whole file in one go; orjson has no stream API, and for the
+        # stdlib path this skips json.load's extra wrapper layer (it reads the
+        # full buffer internally anyway)
+        data = fp.read()
+
+        if (orjson is not None) and (not kwargs):
+            self.from_json_serializable(orjson.loads(data))
+            return self
+
+        self.from_json_serializable(json.loads(data, **kwargs))
 
         return self
 
@@ -223,8 +630,45 @@ class VersionedConfigObject(object):
         """
         Populate this config object from a string containing JSON data
 
-        :param s: string to read JSON data from
+        :param s: string (or bytes/bytearray, which skips the utf-8 decode step)
+            to read JSON data from
         :param kwargs: accepts same kwargs as json.loads function
         """
+        if (orjson is not None) and (not kwargs):
+            self.from_json_serializable(orjson.loads(s))
+            return self
+
         self.from_json_serializable(json.loads(s, **kwargs))
         return self
+
+
+class VersionedConfigJSONEncoder(json.JSONEncoder):
+    """
+    JSONEncoder subclass that understands VersionedConfigObject instances, for
+    passing config objects straight to json.dump/json.dumps
+    (e.g. json.dumps(cfg, cls=VersionedConfigJSONEncoder)). Each config object
+    is expanded one level at a time as the encoder recurses, so no intermediate
+    tree of dicts is built up front. Values that are serializable by neither
+    the json library nor this encoder raise TypeError, per json convention.
+    """
+    def default(self, o):
+        if isinstance(o, VersionedConfigObject):
+            if type(o).to_json_serializable is not VersionedConfigObject.to_json_serializable:
+                # Subclass provides its own serialized representation
+                return o.to_json_serializable()
+
+            # Shallow expansion only; nested config objects are left as-is for
+            # the encoder to recurse into via this method
+            names = o._cached_field_names()[0]
+            attrs = {n: getattr(o, n) for n in names}
+
+            if o._is_versioned:
+                vkey = o.config_version_key
+                if vkey in attrs:
+                    raise ValueError(f"Cannot have an attribute with name {vkey!r}, name is reserved")
+
+                attrs[vkey] = type(o)._resolved_version
+
+            return attrs
+
+        return super().default(o)
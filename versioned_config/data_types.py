@@ -1,5 +1,11 @@
 import base64
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+import versioned_config
 from versioned_config import VersionedConfigObject
 
 
@@ -8,7 +14,13 @@ class BinaryBlob(VersionedConfigObject):
     Allows arbitrary binary blobs to be serialized/deserialized as base64 data
     in JSON files
     """
-    def __init__(self, data=b''):
+
+    __slots__ = ('_bytes',)
+
+    # Shared default payload for blobs created as empty placeholders
+    _EMPTY = b''
+
+    def __init__(self, data=_EMPTY):
         self._bytes = data
 
     @property
@@ -26,7 +38,24 @@ class BinaryBlob(VersionedConfigObject):
         self._bytes = b
 
     def to_json_serializable(self):
-        return base64.b64encode(self._bytes).decode('utf-8')
+        if versioned_config._BLOB_OUTPUT_MODE == 'bytes':
+            # Raw base64 bytes for encoders/sinks that handle bytes themselves
+            if pybase64 is not None:
+                return pybase64.b64encode(self._bytes)
+
+            return base64.b64encode(self._bytes)
+
+        if pybase64 is not None:
+            # SIMD-accelerated, and produces a str directly with no decode step
+            return pybase64.b64encode_as_string(self._bytes)
+
+        # base64 output is pure ASCII, so use the ASCII fast path to build the str
+        return base64.b64encode(self._bytes).decode('ascii')
 
     def from_json_serializable(self, b64_str):
-        self._bytes = base64.b64decode(b64_str.encode('utf-8'))
+        if pybase64 is not None:
+            self._bytes = pybase64.b64decode(b64_str, validate=False)
+            return
+
+        # b64decode accepts str directly; encoding it first just duplicates the payload
+        self._bytes = base64.b64decode(b64_str)